@@ -28,15 +28,19 @@ def as_filename(header_path):
 
 def verbosely_write(path, new_content):
     print(path)
+    new_data = new_content.encode()
     # FIXME: Ensure directory exists
-    if os.path.exists(path):
-        with open(path, 'r') as fp:
-            old_data = fp.read()
-        if old_data == new_content:
-            # Fast path! Don't trigger ninja
-            return
-    with open(path, 'w') as fp:
-        fp.write(new_content)
+    try:
+        # Only read the old file if it could possibly match.
+        if os.stat(path).st_size == len(new_data):
+            with open(path, 'rb') as fp:
+                if fp.read() == new_data:
+                    # Fast path! Don't trigger ninja
+                    return
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as fp:
+        fp.write(new_data)
 
 
 def generate_part(header):
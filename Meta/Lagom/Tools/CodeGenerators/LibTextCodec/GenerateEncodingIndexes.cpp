@@ -71,13 +71,20 @@ void generate_table(SourceGenerator generator, StringView name, LookupTable& tab
         generator.appendln("static constexpr u32 s_@name@_index_first_pointer = @first_pointer@;");
     }
 
-    generator.append("static constexpr Array<@value_type@, @size@> s_@name@_index {\n    ");
+    // NOTE: The larger tables have tens of thousands of entries, so format them all into a single buffer
+    //       rather than creating a String and running placeholder substitution for each one.
+    StringBuilder values;
     for (size_t i = 0; i < table.code_points.size(); i++) {
-        generator.append(MUST(String::formatted("{:#04x}", table.code_points[i])));
-        if (i != table.code_points.size() - 1)
-            generator.append(i % 16 == 15 ? ",\n    "sv : ", "sv);
+        if (i != 0)
+            values.append(i % 16 == 0 ? ",\n    "sv : ", "sv);
+        values.appendff("{:#04x}", table.code_points[i]);
     }
-    generator.appendln("\n};");
+    generator.set("values", MUST(values.to_string()));
+
+    generator.append(R"~~~(static constexpr Array<@value_type@, @size@> s_@name@_index {
+    @values@
+};
+)~~~");
     if (table.generate_accessor)
         generator.appendln("Optional<u32> index_@name@_code_point(u32 pointer);");
 }
@@ -87,7 +94,18 @@ ErrorOr<void> generate_header_file(LookupTables& tables, Core::File& file)
     StringBuilder builder;
     SourceGenerator generator { builder };
 
+    // NOTE: The ranges are split into separate pointer and code point arrays, since looking up a range only needs to
+    //       binary search the pointers.
+    StringBuilder gb18030_range_pointers;
+    StringBuilder gb18030_range_code_points;
+    for (auto const& range : tables.gb18030_ranges.values()) {
+        gb18030_range_pointers.appendff("    {},\n", range.as_array()[0].as_integer<u32>());
+        gb18030_range_code_points.appendff("    {:#04x},\n", range.as_array()[1].as_integer<u32>());
+    }
+
     generator.set("gb18030_ranges_size", MUST(String::number(tables.gb18030_ranges.size())));
+    generator.set("gb18030_range_pointers", MUST(gb18030_range_pointers.to_string()));
+    generator.set("gb18030_range_code_points", MUST(gb18030_range_code_points.to_string()));
 
     generator.append(R"~~~(
 #pragma once
@@ -97,18 +115,13 @@ ErrorOr<void> generate_header_file(LookupTables& tables, Core::File& file)
 
 namespace TextCodec {
 
-struct Gb18030RangeEntry {
-    u32 pointer;
-    u32 code_point;
-};
+static constexpr Array<u32, @gb18030_ranges_size@> s_gb18030_range_pointers {
+@gb18030_range_pointers@};
 
-static constexpr Array<Gb18030RangeEntry, @gb18030_ranges_size@> s_gb18030_ranges { {
-)~~~");
+static constexpr Array<u32, @gb18030_ranges_size@> s_gb18030_range_code_points {
+@gb18030_range_code_points@};
 
-    for (auto const& range : tables.gb18030_ranges.values()) {
-        generator.appendln(MUST(String::formatted("    {{ {}, {:#04x} }},", range.as_array()[0].as_integer<u32>(), range.as_array()[1].as_integer<u32>())));
-    }
-    generator.appendln("} };\n");
+)~~~");
 
     for (auto e : tables.indexes) {
         generate_table(generator.fork(), e.key, e.value);
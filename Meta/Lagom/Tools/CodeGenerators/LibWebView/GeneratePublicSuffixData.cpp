@@ -4,15 +4,15 @@
  * SPDX-License-Identifier: BSD-2-Clause
  */
 
-#include "../LibUnicode/GeneratorUtil.h"
+#include <AK/QuickSort.h>
 #include <AK/SourceGenerator.h>
 #include <AK/StringBuilder.h>
 #include <LibCore/ArgsParser.h>
 #include <LibCore/File.h>
 #include <LibMain/Main.h>
 
-ErrorOr<void> generate_header_file(Core::InputBufferedFile&, Core::File&);
-ErrorOr<void> generate_implementation_file(Core::InputBufferedFile&, Core::File&);
+ErrorOr<void> generate_header_file(Core::File&);
+ErrorOr<void> generate_implementation_file(StringView public_suffix_list, Core::File&);
 
 ErrorOr<int> serenity_main(Main::Arguments arguments)
 {
@@ -26,18 +26,19 @@ ErrorOr<int> serenity_main(Main::Arguments arguments)
     args_parser.add_option(public_suffix_list_path, "Path to the public suffix list", "public-suffix-list-path", 'p', "public-suffix-list-path");
     args_parser.parse(arguments);
 
-    auto identifier_data = TRY(open_file(public_suffix_list_path, Core::File::OpenMode::Read));
+    auto public_suffix_list_file = TRY(Core::File::open(public_suffix_list_path, Core::File::OpenMode::Read));
+    auto public_suffix_list = TRY(public_suffix_list_file->read_until_eof());
 
     auto generated_header_file = TRY(Core::File::open(generated_header_path, Core::File::OpenMode::Write));
     auto generated_implementation_file = TRY(Core::File::open(generated_implementation_path, Core::File::OpenMode::Write));
 
-    TRY(generate_header_file(*identifier_data, *generated_header_file));
-    TRY(generate_implementation_file(*identifier_data, *generated_implementation_file));
+    TRY(generate_header_file(*generated_header_file));
+    TRY(generate_implementation_file(public_suffix_list, *generated_implementation_file));
 
     return 0;
 }
 
-ErrorOr<void> generate_header_file(Core::InputBufferedFile&, Core::File& file)
+ErrorOr<void> generate_header_file(Core::File& file)
 {
     StringBuilder builder;
     SourceGenerator generator { builder };
@@ -45,14 +46,12 @@ ErrorOr<void> generate_header_file(Core::InputBufferedFile&, Core::File& file)
 #pragma once
 
 #include <AK/Forward.h>
-#include <AK/Trie.h>
-#include <AK/Variant.h>
 
 namespace WebView {
 
 class PublicSuffixData {
 protected:
-    PublicSuffixData();
+    PublicSuffixData() = default;
 
 public:
     PublicSuffixData(PublicSuffixData const&) = delete;
@@ -68,9 +67,6 @@ public:
 
     bool is_public_suffix(StringView host);
     ErrorOr<Optional<String>> get_public_suffix(StringView string);
-
-private:
-    Trie<char, Empty> m_dictionary;
 };
 
 }
@@ -81,11 +77,32 @@ private:
     return {};
 }
 
-ErrorOr<void> generate_implementation_file(Core::InputBufferedFile& input, Core::File& file)
+// Appends the domain with its labels in reverse order, e.g. "foo.co.uk" is appended as "uk.co.foo".
+static void append_with_reversed_labels(StringBuilder& builder, StringView domain)
+{
+    bool is_first_label = true;
+    auto append_label = [&](StringView label) {
+        if (label.is_empty())
+            return;
+        if (!is_first_label)
+            builder.append('.');
+        builder.append(label);
+        is_first_label = false;
+    };
+
+    for (auto index = domain.find_last('.'); index.has_value(); index = domain.find_last('.')) {
+        append_label(domain.substring_view(*index + 1));
+        domain = domain.substring_view(0, *index);
+    }
+    append_label(domain);
+}
+
+ErrorOr<void> generate_implementation_file(StringView public_suffix_list, Core::File& file)
 {
     StringBuilder builder;
     SourceGenerator generator { builder };
     generator.append(R"~~~(
+#include <AK/BinarySearch.h>
 #include <AK/String.h>
 #include <AK/Vector.h>
 #include <LibWebView/PublicSuffixData.h>
@@ -94,43 +111,35 @@ namespace WebView {
 
 static constexpr auto s_public_suffixes = Array {)~~~");
 
-    Array<u8, 1024> buffer {};
-
-    while (TRY(input.can_read_line())) {
-        auto line = TRY(input.read_line(buffer));
+    Vector<String> public_suffixes;
+    StringBuilder public_suffix;
 
+    for (auto line : public_suffix_list.lines()) {
         if (line.starts_with("//"sv) || line.is_empty())
             continue;
 
-        auto view = line.split_view("."sv);
-        view.reverse();
+        public_suffix.clear();
+        append_with_reversed_labels(public_suffix, line);
+        TRY(public_suffixes.try_append(TRY(public_suffix.to_string())));
+    }
 
-        StringBuilder builder;
-        builder.join("."sv, view);
-        auto val = builder.string_view();
+    // NOTE: The suffixes are sorted here so that is_public_suffix() can binary search them, instead of building
+    //       a trie out of them at runtime.
+    quick_sort(public_suffixes, [](auto const& lhs, auto const& rhs) {
+        return lhs.bytes_as_string_view() < rhs.bytes_as_string_view();
+    });
 
-        generator.set("line", val);
-        generator.append(R"~~~(
-    "@line@"sv,)~~~");
-    }
+    StringBuilder public_suffix_array_entries;
+    for (auto const& public_suffix : public_suffixes)
+        public_suffix_array_entries.appendff("\n    \"{}\"sv,", public_suffix);
 
-    generator.append(R"~~~(
+    generator.set("public_suffixes", TRY(public_suffix_array_entries.to_string()));
+    generator.append(R"~~~(@public_suffixes@
 };
 
-PublicSuffixData::PublicSuffixData()
-    : m_dictionary('/')
-{
-    // FIXME: Reduce the depth of this trie
-    for (auto str : s_public_suffixes) {
-        MUST(m_dictionary.insert(str.begin(), str.end(), Empty {}, [](auto const&, auto const&) -> Optional<Empty> { return {}; }));
-    }
-}
-
 bool PublicSuffixData::is_public_suffix(StringView host)
 {
-    auto it = host.begin();
-    auto& node = m_dictionary.traverse_until_last_accessible_node(it, host.end());
-    return it.is_end() && node.has_metadata();
+    return binary_search(s_public_suffixes, host) != nullptr;
 }
 
 ErrorOr<Optional<String>> PublicSuffixData::get_public_suffix(StringView string)
@@ -138,33 +147,30 @@ ErrorOr<Optional<String>> PublicSuffixData::get_public_suffix(StringView string)
     auto input = string.split_view("."sv);
     input.reverse();
 
-    StringBuilder overall_search_string;
+    // NOTE: The matched suffix (in reversed label order, each label followed by a '.') is kept at the front of
+    //       search_string, and each candidate is formed by appending to it in place.
     StringBuilder search_string;
+    size_t matched_length = 0;
     for (auto part : input) {
-        search_string.clear();
-        TRY(search_string.try_append(TRY(overall_search_string.to_string())));
+        search_string.trim(search_string.length() - matched_length);
         TRY(search_string.try_append(part));
 
-        if (is_public_suffix(search_string.string_view())) {
-            overall_search_string.append(TRY(String::from_utf8(part)));
-            overall_search_string.append("."sv);
-            continue;
-        }
+        if (!is_public_suffix(search_string.string_view())) {
+            search_string.trim(part.length());
+            TRY(search_string.try_append('*'));
 
-        search_string.clear();
-        TRY(search_string.try_append(TRY(overall_search_string.to_string())));
-        TRY(search_string.try_append("*"sv));
+            if (!is_public_suffix(search_string.string_view()))
+                break;
 
-        if (is_public_suffix(search_string.string_view())) {
-            overall_search_string.append(TRY(String::from_utf8(part)));
-            overall_search_string.append("."sv);
-            continue;
+            search_string.trim(1);
+            TRY(search_string.try_append(part));
         }
 
-        break;
+        TRY(search_string.try_append('.'));
+        matched_length = search_string.length();
     }
 
-    auto view = overall_search_string.string_view().split_view("."sv);
+    auto view = search_string.string_view().substring_view(0, matched_length).split_view("."sv);
     view.reverse();
 
     StringBuilder return_string_builder;
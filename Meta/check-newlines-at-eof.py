@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 
 import os
-import re
-import subprocess
 import sys
 
+from tracked_files import find_files_here_or_argv
 
-RE_RELEVANT_FILE_EXTENSION = re.compile('\\.(cpp|h|gml|html|js|css|sh|py|json|txt)$')
+
+RELEVANT_FILE_EXTENSIONS = ('.cpp', '.h', '.gml', '.html', '.js', '.css', '.sh', '.py', '.json', '.txt')
+
+TAIL_CHUNK_SIZE = 64
 
 
 def should_check_file(filename):
-    if not RE_RELEVANT_FILE_EXTENSION.search(filename):
+    if not filename.endswith(RELEVANT_FILE_EXTENSIONS):
         return False
     if filename.startswith('Tests/LibWeb/Layout/'):
         return False
@@ -19,14 +21,27 @@ def should_check_file(filename):
     return True
 
 
-def find_files_here_or_argv():
-    if len(sys.argv) > 1:
-        raw_list = sys.argv[1:]
-    else:
-        process = subprocess.run(["git", "ls-files"], check=True, capture_output=True)
-        raw_list = process.stdout.decode().strip('\n').split('\n')
+def check_file(filename):
+    """Returns a (no_newline_at_eof, blank_lines_at_eof) pair for the given file."""
+    with open(filename, "rb") as f:
+        offset = f.seek(0, os.SEEK_END)
+        tail = b''
+
+        # Only the trailing whitespace matters, so read the file backwards in small chunks
+        # until we find something that isn't whitespace.
+        while True:
+            chunk_size = min(TAIL_CHUNK_SIZE, offset)
+            offset -= chunk_size
+            f.seek(offset, os.SEEK_SET)
+            tail = f.read(chunk_size) + tail
 
-    return filter(should_check_file, raw_list)
+            if not tail.endswith((b'\n', b'\r')):
+                return True, False
+
+            content = tail.rstrip()
+            if content or offset == 0:
+                trailing_whitespace = tail[len(content):].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                return False, trailing_whitespace.count(b'\n') > 1
 
 
 def run():
@@ -34,26 +49,14 @@ def run():
     no_newline_at_eof_errors = []
     blank_lines_at_eof_errors = []
 
-    did_fail = False
-    for filename in find_files_here_or_argv():
-        with open(filename, "r") as f:
-            f.seek(0, os.SEEK_END)
-
-            f.seek(f.tell() - 1, os.SEEK_SET)
-            if f.read(1) != '\n':
-                did_fail = True
-                no_newline_at_eof_errors.append(filename)
-                continue
-
-            while True:
-                f.seek(f.tell() - 2, os.SEEK_SET)
-                char = f.read(1)
-                if not char.isspace():
-                    break
-                if char == '\n':
-                    did_fail = True
-                    blank_lines_at_eof_errors.append(filename)
-                    break
+    for filename in find_files_here_or_argv(should_check_file):
+        no_newline_at_eof, blank_lines_at_eof = check_file(filename)
+        if no_newline_at_eof:
+            no_newline_at_eof_errors.append(filename)
+        if blank_lines_at_eof:
+            blank_lines_at_eof_errors.append(filename)
+
+    did_fail = bool(no_newline_at_eof_errors or blank_lines_at_eof_errors)
 
     if no_newline_at_eof_errors:
         print("Files with no newline at the end:", " ".join(no_newline_at_eof_errors))
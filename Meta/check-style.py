@@ -3,9 +3,10 @@
 import os
 import pathlib
 import re
-import subprocess
 import sys
 
+from tracked_files import find_files_here_or_argv
+
 # Ensure copyright headers match this format and are followed by a blank line:
 # /*
 #  * Copyright (c) YYYY(-YYYY), Whatever
@@ -61,23 +62,13 @@ LOCAL_INCLUDE_SUFFIX_EXCLUDES = [
 
 
 def should_check_file(filename):
-    if not filename.endswith('.cpp') and not filename.endswith('.h'):
+    if not filename.endswith(('.cpp', '.h')):
         return False
     if filename.startswith('Base/'):
         return False
     return True
 
 
-def find_files_here_or_argv():
-    if len(sys.argv) > 1:
-        raw_list = sys.argv[1:]
-    else:
-        process = subprocess.run(["git", "ls-files"], check=True, capture_output=True)
-        raw_list = process.stdout.decode().strip('\n').split('\n')
-
-    return filter(should_check_file, raw_list)
-
-
 def is_in_prefix_list(filename, prefix_list):
     return any(
         filename.startswith(prefix) for prefix in prefix_list
@@ -99,7 +90,7 @@ def run():
     errors_include_missing_local = []
     errors_include_bad_complex = []
 
-    for filename in find_files_here_or_argv():
+    for filename in find_files_here_or_argv(should_check_file):
         with open(filename, "r") as f:
             file_content = f.read()
         if not is_in_prefix_list(filename, LICENSE_HEADER_CHECK_EXCLUDES):
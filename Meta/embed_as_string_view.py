@@ -4,6 +4,8 @@ r"""
 """
 
 import argparse
+import contextlib
+import os
 import sys
 
 
@@ -20,18 +22,27 @@ def main():
                         help='C++ namespace to put the string into')
     args = parser.parse_args()
 
-    with open(args.output, 'w') as f:
-        f.write("#include <AK/StringView.h>\n")
-        if args.namespace:
-            f.write(f"namespace {args.namespace} {{\n")
-        f.write(f"extern StringView {args.variable_name};\n")
-        f.write(f"StringView {args.variable_name} = R\"~~~(")
-        with open(args.input, 'r') as input:
-            for line in input.readlines():
-                f.write(f"{line}")
-        f.write(")~~~\"sv;\n")
-        if args.namespace:
-            f.write("}\n")
+    with open(args.input, 'r', encoding='utf-8') as input:
+        contents = input.read()
+
+    output = ["#include <AK/StringView.h>\n"]
+    if args.namespace:
+        output.append(f"namespace {args.namespace} {{\n")
+    output.append(f"extern StringView {args.variable_name};\n")
+    output.append(f"StringView {args.variable_name} = R\"~~~({contents})~~~\"sv;\n")
+    if args.namespace:
+        output.append("}\n")
+
+    # Write the whole file at once and move it into place, so a failed run never leaves a truncated output behind.
+    temporary_output = f"{args.output}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_output, 'wb') as f:
+            f.write("".join(output).encode())
+        os.replace(temporary_output, args.output)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temporary_output)
+        raise
 
 
 if __name__ == '__main__':
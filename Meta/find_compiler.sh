@@ -8,21 +8,34 @@ is_supported_compiler() {
         return 1
     fi
 
-    local VERSION=""
-    VERSION="$($COMPILER -dumpversion 2> /dev/null)" || return 1
-    local MAJOR_VERSION=""
-    MAJOR_VERSION="${VERSION%%.*}"
-    if $COMPILER --version 2>&1 | grep "Apple clang" >/dev/null; then
+    # A single preprocessor run tells us both the compiler family and its version.
+    local DEFINES=""
+    DEFINES="$($COMPILER -dM -E - < /dev/null 2> /dev/null)" || return 1
+
+    # Pick out the macros we care about in one pass, without spawning a grep for each of them.
+    local APPLE_BUILD_VERSION=""
+    local CLANG_MAJOR_VERSION=""
+    local GCC_MAJOR_VERSION=""
+    local NAME=""
+    local VALUE=""
+    while read -r _ NAME VALUE; do
+        case "$NAME" in
+            __apple_build_version__) APPLE_BUILD_VERSION="$VALUE" ;;
+            __clang_major__) CLANG_MAJOR_VERSION="$VALUE" ;;
+            __GNUC__) GCC_MAJOR_VERSION="$VALUE" ;;
+        esac
+    done <<< "$DEFINES"
+
+    if [ -n "$APPLE_BUILD_VERSION" ]; then
         # Apple Clang version check
-        BUILD_VERSION=$(echo | $COMPILER -dM -E - | grep __apple_build_version__ | cut -d ' ' -f3)
         # Xcode 14.3, based on upstream LLVM 15
-        [ "$BUILD_VERSION" -ge 14030022 ] && return 0
-    elif $COMPILER --version 2>&1 | grep "clang" >/dev/null; then
+        [ "$APPLE_BUILD_VERSION" -ge 14030022 ] && return 0
+    elif [ -n "$CLANG_MAJOR_VERSION" ]; then
         # Clang version check
-        [ "$MAJOR_VERSION" -ge 17 ] && return 0
-    else
+        [ "$CLANG_MAJOR_VERSION" -ge 17 ] && return 0
+    elif [ -n "$GCC_MAJOR_VERSION" ]; then
         # GCC version check
-        [ "$MAJOR_VERSION" -ge 13 ] && return 0
+        [ "$GCC_MAJOR_VERSION" -ge 13 ] && return 0
     fi
     return 1
 }
@@ -30,15 +43,17 @@ is_supported_compiler() {
 find_newest_compiler() {
     local BEST_VERSION=0
     local BEST_CANDIDATE=""
+    local PROBED_PATHS=""
     for CANDIDATE in "$@"; do
-        if ! command -v "$CANDIDATE" >/dev/null 2>&1; then
-            continue
-        fi
-        if ! $CANDIDATE -dumpversion >/dev/null 2>&1; then
-            continue
-        fi
+        local CANDIDATE_PATH=""
+        CANDIDATE_PATH="$(command -v "$CANDIDATE" 2>/dev/null)" || continue
+        # Several candidate names can resolve to the same binary, only probe each one once.
+        case " $PROBED_PATHS " in
+            *" $CANDIDATE_PATH "*) continue ;;
+        esac
+        PROBED_PATHS="$PROBED_PATHS $CANDIDATE_PATH"
         local VERSION=""
-        VERSION="$($CANDIDATE -dumpversion)"
+        VERSION="$($CANDIDATE -dumpversion 2>/dev/null)" || continue
         local MAJOR_VERSION="${VERSION%%.*}"
         if [ "$MAJOR_VERSION" -gt "$BEST_VERSION" ]; then
             BEST_VERSION=$MAJOR_VERSION
@@ -36,20 +36,20 @@ def main():
         epilog=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('url', help='input url')
-    parser.add_argument('-o', '--output', required=True,
+    parser.add_argument('-o', '--output', required=True, type=pathlib.Path,
                         help='output file')
     parser.add_argument('-v', '--version', required=True,
                         help='version of file to detect mismatches and redownload')
-    parser.add_argument('-f', '--version-file', required=True,
+    parser.add_argument('-f', '--version-file', required=True, type=pathlib.Path,
                         help='filesystem location to cache version')
-    parser.add_argument('-c', "--cache-path", required=False,
+    parser.add_argument('-c', "--cache-path", required=False, type=pathlib.Path,
                         help='path for cached files to clear on version mismatch')
     parser.add_argument('-s', "--sha256", required=False,
                         help='expected SHA-256 hash of the downloaded file')
     args = parser.parse_args()
 
     version_from_file = ''
-    version_file = pathlib.Path(args.version_file)
+    version_file = args.version_file
     if version_file.exists():
         with version_file.open('r') as f:
             version_from_file = f.readline().strip()
@@ -59,17 +59,17 @@ def main():
 
     # Fresh build or version mismatch, delete old cache
     if args.cache_path:
-        cache_path = pathlib.Path(args.cache_path)
+        cache_path = args.cache_path
         shutil.rmtree(cache_path, ignore_errors=True)
         cache_path.mkdir(parents=True)
 
-    output_file = pathlib.Path(args.output)
+    output_file = args.output
     print(f"Downloading file {output_file} from {args.url}")
 
     with urllib.request.urlopen(args.url) as f:
         try:
             with tempfile.NamedTemporaryFile(delete=False, dir=output_file.parent) as out:
-                out.write(f.read())
+                shutil.copyfileobj(f, out, 256 << 10)
                 os.rename(out.name, output_file)
         except IOError:
             os.unlink(out.name)
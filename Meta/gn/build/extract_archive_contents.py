@@ -58,16 +58,16 @@ def main():
     parser = argparse.ArgumentParser(
                  epilog=__doc__,
                  formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument('archive', help='input archive')
+    parser.add_argument('archive', type=pathlib.Path, help='input archive')
     parser.add_argument('paths', nargs='*', help='paths to extract from the archive')
-    parser.add_argument('-s', "--stamp", required=False,
+    parser.add_argument('-s', "--stamp", required=False, type=pathlib.Path,
                         help='stamp file name to create after operation is done')
-    parser.add_argument('-d', "--destination", required=True,
+    parser.add_argument('-d', "--destination", required=True, type=pathlib.Path,
                         help='directory to write the extracted file to')
     args = parser.parse_args()
 
-    archive = pathlib.Path(args.archive)
-    destination = pathlib.Path(args.destination)
+    archive = args.archive
+    destination = args.destination
 
     def extract_paths(file, paths):
         for path in paths:
@@ -87,7 +87,7 @@ def main():
         return 1
 
     if args.stamp:
-        pathlib.Path(args.stamp).touch()
+        args.stamp.touch()
 
     return 0
 
@@ -0,0 +1,22 @@
+"""
+Shared file discovery for the Meta/check-*.py linters.
+"""
+
+import subprocess
+import sys
+
+
+def tracked_files():
+    """Returns the paths of all files tracked by git, relative to the repository root."""
+    # NUL-separated output keeps git from quoting unusual paths, so the paths can be used as-is.
+    process = subprocess.run(["git", "ls-files", "-z"], check=True, capture_output=True)
+    return process.stdout.decode().split('\0')[:-1]
+
+
+def find_files_here_or_argv(should_check_file):
+    if len(sys.argv) > 1:
+        raw_list = sys.argv[1:]
+    else:
+        raw_list = tracked_files()
+
+    return filter(should_check_file, raw_list)
@@ -15,19 +15,19 @@ import os
 
 
 def concat_metadata_files(metadata_directory):
-    concatenated_metadata = ""
+    concatenated_metadata = []
 
     for root, _, files in os.walk(metadata_directory):
+        relative_root = os.path.relpath(root, metadata_directory)
         for filename in files:
             if filename.endswith(".ini"):
                 filepath = os.path.join(root, filename)
-                relative_path = os.path.relpath(filepath, metadata_directory)
+                relative_path = filename if relative_root == os.curdir else os.path.join(relative_root, filename)
                 with open(filepath, "r") as file:
                     file_content = file.read()
-                    concatenated_metadata += f"--- {relative_path} ---\n"
-                    concatenated_metadata += file_content + "\n"
+                    concatenated_metadata.append(f"--- {relative_path} ---\n{file_content}\n")
 
-    return concatenated_metadata
+    return "".join(concatenated_metadata)
 
 
 def extract_metadata_files(concatenated_metadata_file, output_metadata_directory):
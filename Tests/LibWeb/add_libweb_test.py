@@ -9,12 +9,12 @@ from pathlib import Path
 TEST_DIR = Path(__file__).resolve().parent
 
 
-def create_text_test(test_name: str, is_async: bool = False) -> None:
+def create_text_test(test_name: Path, is_async: bool = False) -> None:
     """
     Create a new Text type test file with the given test name.
 
     Args:
-        test_name (str): Name of the test.
+        test_name (Path): Name of the test.
         is_async (bool, optional): Whether it is an async test. Defaults to False.
     """
     input_prefix = TEST_DIR / "Text" / "input" / test_name
@@ -29,7 +29,7 @@ def create_text_test(test_name: str, is_async: bool = False) -> None:
     input_dir.mkdir(parents=True, exist_ok=True)
     expected_dir.mkdir(parents=True, exist_ok=True)
 
-    num_sub_levels = len(Path(test_name).parents) - 1
+    num_sub_levels = len(test_name.parents) - 1
     path_to_include_js = "../" * num_sub_levels + "include.js"
 
     # Create input and expected files
@@ -44,12 +44,12 @@ def create_text_test(test_name: str, is_async: bool = False) -> None:
 """)
     expected_file.write_text("Expected println() output\n")
 
-    print(f"Text test '{Path(test_name).with_suffix('.html')}' created successfully.")
+    print(f"Text test '{test_name.with_suffix('.html')}' created successfully.")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Create a new LibWeb Text test file.")
-    parser.add_argument("test_name", type=str, help="Name of the test")
+    parser.add_argument("test_name", type=Path, help="Name of the test")
     parser.add_argument("--async", action="store_true", help="Flag to indicate if it's an async test", dest="is_async")
     args = parser.parse_args()
 
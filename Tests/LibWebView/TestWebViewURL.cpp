@@ -88,6 +88,24 @@ TEST_CASE(http_url)
     compare_url_parts("http://abc.def.com?query"sv, { "http://abc."sv, "def.com"sv, "?query"sv });
 }
 
+TEST_CASE(public_suffix)
+{
+    EXPECT_EQ(WebView::get_public_suffix("co.uk"sv), "co.uk"_string);
+    EXPECT_EQ(WebView::get_public_suffix("abc.co.uk"sv), "co.uk"_string);
+    EXPECT_EQ(WebView::get_public_suffix("abc.def.co.uk"sv), "co.uk"_string);
+
+    compare_url_parts("http://abc.co.uk"sv, { "http://"sv, "abc.co.uk"sv, {} });
+    compare_url_parts("http://abc.def.co.uk"sv, { "http://abc."sv, "def.co.uk"sv, {} });
+    compare_url_parts("http://abc.def.ghi.co.uk/path"sv, { "http://abc.def."sv, "ghi.co.uk"sv, "/path"sv });
+
+    // "ck" is only covered by the wildcard rule "*.ck", so the lookup has to probe the wildcard before giving up.
+    EXPECT(!WebView::is_public_suffix("ck"sv));
+    EXPECT(!WebView::get_public_suffix("abc.ck"sv).has_value());
+    EXPECT(!WebView::get_public_suffix("abc.def.ck"sv).has_value());
+
+    compare_url_parts("http://abc.def.ck"sv, { "http://"sv, "abc.def.ck"sv, {} });
+}
+
 TEST_CASE(about_url)
 {
     EXPECT(!is_sanitized_url_the_same("about"sv));
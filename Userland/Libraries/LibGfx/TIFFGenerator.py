@@ -624,10 +624,10 @@ def update_file(target: Path, new_content: str):
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('-o', '--output')
+    parser.add_argument('-o', '--output', type=Path)
     args = parser.parse_args()
 
-    output_path = Path(args.output)
+    output_path = args.output
 
     update_file(output_path / 'TIFFMetadata.h', generate_metadata_file(known_tags))
     update_file(output_path / 'TIFFTagHandler.cpp', generate_tag_handler_file(known_tags))
@@ -681,11 +681,11 @@ static Optional<u32> index_gb18030_ranges_code_point(u32 pointer)
 
     // 3. Let offset be the last pointer in index gb18030 ranges that is less than or equal to pointer and let code point offset be its corresponding code point.
     size_t last_index;
-    binary_search(s_gb18030_ranges, pointer, &last_index, [](auto const pointer, auto const& entry) {
-        return pointer - entry.pointer;
+    binary_search(s_gb18030_range_pointers, pointer, &last_index, [](auto const pointer, auto const range_pointer) {
+        return pointer - range_pointer;
     });
-    auto offset = s_gb18030_ranges[last_index].pointer;
-    auto code_point_offset = s_gb18030_ranges[last_index].code_point;
+    auto offset = s_gb18030_range_pointers[last_index];
+    auto code_point_offset = s_gb18030_range_code_points[last_index];
 
     // 4. Return a code point whose value is code point offset + pointer − offset.
     return code_point_offset + pointer - offset;